@@ -1,22 +1,158 @@
 ﻿import os
+import re
 import sys
 import cv2
 import numpy as np
 import shutil
 import subprocess
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from io import BytesIO
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLabel, QPushButton,
     QVBoxLayout, QWidget, QFileDialog, QTextEdit, QMessageBox
 )
 from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtCore import Qt
-from passporteye import read_mrz
-import pytesseract
+from PyQt5.QtCore import Qt, QSettings, QObject, QRunnable, QThreadPool, pyqtSignal
+import threading
+
+# passporteye, pytesseract, and tesserocr are imported lazily on first scan
+# (see _ensure_ocr): they account for a noticeable slice of cold start, and
+# the window should paint before the OCR stack loads.
+
+MRZ_CHAR_WHITELIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789<'
+MRZ_BAND_FRACTION = 0.3
+MRZ_TARGET_CHAR_HEIGHT = 35  # px; Tesseract's LSTM accuracy/speed sweet spot
+CUR_YY = datetime.now().year % 100
+
+def _scan_one(path, tessdata_dir=None, lang='eng'):
+    """Process-pool worker: OCR one passport image, returning its MRZ dict or None.
+
+    Runs the same band-crop + binarize + read_mrz pipeline as the GUI, but
+    stays CLI-based and CPU-only so it pickles cleanly and the pool processes
+    don't fight over one GPU. OMP_THREAD_LIMIT=1 is inherited from the parent,
+    so parallelism comes purely from sharding images across processes.
+    """
+    img = cv2.imread(path, cv2.IMREAD_REDUCED_COLOR_2)
+    if img is None:
+        return None
+    h = img.shape[0]
+    band = img[int(h * (1 - MRZ_BAND_FRACTION)):, :]
+    scale = MRZ_TARGET_CHAR_HEIGHT / (band.shape[0] / 8)
+    if scale < 1.0:
+        band = cv2.resize(band, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(band, cv2.COLOR_BGR2GRAY)
+    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    _, png_data = cv2.imencode('.png', thresh)
+    params = f'-l {lang} --psm 6 -c tessedit_char_whitelist=' + MRZ_CHAR_WHITELIST
+    if tessdata_dir:
+        params = f'--tessdata-dir {tessdata_dir} ' + params
+    from passporteye import read_mrz
+    mrz = read_mrz(BytesIO(png_data.tobytes()), extra_cmdline_params=params)
+    return mrz.to_dict() if mrz else None
+
+class MrzScanSignals(QObject):
+    finished = pyqtSignal(str, object, object, int, bool)  # path, mrz, img, roi_y0, mrz_in_band
+    error = pyqtSignal(str, str)  # path, message
+
+class MrzScanWorker(QRunnable):
+    """Run imread + preprocess + OCR off the GUI thread.
+
+    The OCR alone blocks for hundreds of milliseconds; doing it on the Qt
+    event loop freezes the window. Results come back via MrzScanSignals so
+    all widget updates stay on the GUI thread. The scan button is disabled
+    while scanning, but the startup warmup worker can still overlap a scan,
+    so ocr_mrz serializes access to the shared persistent OCR engine.
+    """
+    def __init__(self, app, path, img=None):
+        super().__init__()
+        self.app = app
+        self.path = path
+        self.img = img
+        self.signals = MrzScanSignals()
+
+    def run(self):
+        try:
+            # Reuse the frame load_image already decoded when available;
+            # otherwise do a half-resolution decode (the codec can skip
+            # high-frequency IDCT work, and MRZ OCR rarely benefits beyond
+            # ~1500px of width).
+            img = self.img
+            if img is None:
+                img = cv2.imread(self.path, cv2.IMREAD_REDUCED_COLOR_2)
+            processed_img, roi_y0 = self.app.preprocess_image(img)
+            mrz = self.app.ocr_mrz(processed_img)
+            mrz_in_band = mrz is not None
+            if not mrz:
+                # The band heuristic can miss rotated or unusually framed
+                # scans; retry on the full image before giving up.
+                processed_img, roi_y0 = self.app.preprocess_image(img, full_page=True)
+                mrz = self.app.ocr_mrz(processed_img)
+            if not mrz:
+                # Last resort: re-decode at full resolution in case the
+                # reduced scan left the MRZ characters too small to read.
+                img = cv2.imread(self.path)
+                processed_img, roi_y0 = self.app.preprocess_image(img, full_page=True)
+                mrz = self.app.ocr_mrz(processed_img)
+            self.signals.finished.emit(self.path, mrz, img, roi_y0, mrz_in_band)
+        except Exception as e:
+            self.signals.error.emit(self.path, str(e))
+
+class FolderScanSignals(QObject):
+    progress = pyqtSignal(str, object)  # path, mrz data dict or None
+    finished = pyqtSignal(int)  # number of images scanned
+    error = pyqtSignal(str)
+
+class FolderScanWorker(QRunnable):
+    """Drive a batch folder scan off the GUI thread.
+
+    The process pool already does the OCR work; this runnable only keeps the
+    blocking iteration over its results away from the Qt event loop, emitting
+    each image's result as it completes so the window keeps painting and the
+    output fills in per image instead of freezing for the whole folder.
+    """
+    def __init__(self, app, paths):
+        super().__init__()
+        self.app = app
+        self.paths = paths
+        self.signals = FolderScanSignals()
+
+    def run(self):
+        try:
+            self.app.scan_mrz_batch(self.paths, on_result=self.signals.progress.emit)
+            self.signals.finished.emit(len(self.paths))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+class WarmupWorker(QRunnable):
+    """Page in the heavy scan dependencies before the first real scan.
+
+    On cold start the first cv2 decode lazily loads the image codecs and the
+    first OCR call pays Tesseract init; running a throwaway round of each in
+    the background right after startup moves that cost off the user's first
+    scan. Best-effort only — real scans surface their own errors.
+    """
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def run(self):
+        try:
+            tiny = np.zeros((8, 8, 3), dtype=np.uint8)
+            _, png = cv2.imencode('.png', tiny)
+            cv2.imdecode(png, cv2.IMREAD_COLOR)
+            cv2.cvtColor(tiny, cv2.COLOR_BGR2GRAY)
+            self.app.ocr_mrz(np.full((8, 8), 255, dtype=np.uint8))
+        except Exception:
+            pass
 
 class PassportScannerApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, warm_start=True):
         super().__init__()
+        # Tesseract's OMP worker threads thrash on a one-image-at-a-time
+        # workload; pin it to a single thread for deterministic CPU usage.
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
         self.setWindowTitle("Passport MRZ Scanner")
         self.setGeometry(100, 100, 800, 600)
         self.is_expiration_date = False
@@ -43,21 +179,130 @@ class PassportScannerApp(QMainWindow):
         self.scan_button.clicked.connect(self.scan_mrz)
         self.scan_button.setEnabled(False)
         self.layout.addWidget(self.scan_button)
+
+        self.scan_folder_button = QPushButton("Scan Folder")
+        self.scan_folder_button.clicked.connect(self.scan_folder)
+        self.layout.addWidget(self.scan_folder_button)
         
         self.central_widget.setLayout(self.layout)
         
         self.current_image_path = None
+        self._bgr = None
+        self._scan_in_flight = None
+        self.tessdata_dir = self.find_tessdata_fast()
+        if self.tessdata_dir:
+            os.environ['TESSDATA_PREFIX'] = self.tessdata_dir
+        self.ocr_lang = self.find_mrz_language()
+        self.ocr_api = None
+        self._ocr_ready = False
+        self._ocr_lock = threading.Lock()
         self.tesseract_path = self.find_tesseract()
         
         if not self.tesseract_path:
             self.show_tesseract_help()
+
+        if warm_start:
+            QThreadPool.globalInstance().start(WarmupWorker(self))
+
+    def find_tessdata_fast(self):
+        """Locate a tessdata_fast directory, preferring fast models over best.
+
+        The default tessdata ("best") LSTM weights dominate per-scan cost; the
+        fast models are several times quicker with negligible accuracy loss on
+        the constrained MRZ character set. Returns the directory path, or None
+        to leave Tesseract on its default (best) model search path.
+        """
+        candidates = []
+        prefix = os.environ.get('TESSDATA_PREFIX')
+        if prefix:
+            candidates.append(os.path.join(os.path.dirname(prefix.rstrip(os.sep)), 'tessdata_fast'))
+        if sys.platform == 'win32':
+            candidates += [
+                r'C:\Program Files\Tesseract-OCR\tessdata_fast',
+                r'C:\Program Files (x86)\Tesseract-OCR\tessdata_fast'
+            ]
         else:
-            pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
+            candidates += [
+                '/usr/share/tessdata_fast',
+                '/usr/local/share/tessdata_fast',
+                '/usr/share/tesseract-ocr/5/tessdata_fast',
+                '/usr/share/tesseract-ocr/4.00/tessdata_fast'
+            ]
+        for path in candidates:
+            if os.path.isdir(path):
+                return path
+        return None
+
+    def find_mrz_language(self):
+        """Pick the single language Tesseract should load.
+
+        The dedicated 'mrz' traineddata (shipped alongside passporteye) is
+        trained on OCR-B and beats 'eng' on MRZ text; fall back to 'eng' when
+        it is not installed. Naming exactly one language keeps Tesseract from
+        loading every traineddata file it can find.
+        """
+        if self.tessdata_dir and os.path.exists(os.path.join(self.tessdata_dir, 'mrz.traineddata')):
+            return 'mrz'
+        return 'eng'
+
+    def _ensure_ocr(self):
+        """Import and initialize the OCR stack on first use.
+
+        Importing passporteye/pytesseract (and tesserocr when present) at
+        module level delays the first paint for a window that may never be
+        used to scan. Deferring them here keeps startup light, and the
+        warmup worker triggers this off the GUI thread right after launch.
+        """
+        if self._ocr_ready:
+            return
+        with self._ocr_lock:
+            if self._ocr_ready:
+                return
+            global read_mrz, MRZ, tesserocr
+            from passporteye import read_mrz
+            from passporteye.mrz.text import MRZ
+            import pytesseract
+            try:
+                import tesserocr
+            except ImportError:
+                tesserocr = None
+            if self.tesseract_path:
+                pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
+            self.ocr_api = self.init_ocr_api()
+            self._ocr_ready = True
+
+    def init_ocr_api(self):
+        """Build a persistent in-process Tesseract engine (tesserocr) once.
+
+        read_mrz spawns the tesseract CLI on every call, paying engine init and
+        language-data load each time. Keeping one PyTessBaseAPI alive for the
+        app's lifetime amortizes that cost. Returns None when tesserocr is not
+        installed; scan_mrz then falls back to the CLI path.
+        """
+        if tesserocr is None:
+            return None
+        try:
+            if self.tessdata_dir:
+                api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK, lang=self.ocr_lang, path=self.tessdata_dir)
+            else:
+                api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK, lang=self.ocr_lang)
+            api.SetVariable('tessedit_char_whitelist', MRZ_CHAR_WHITELIST)
+            return api
+        except Exception as e:
+            print(f"Could not initialize tesserocr, falling back to CLI: {e}")
+            return None
 
     def find_tesseract(self):
+        # A previously discovered path is persisted so later launches skip
+        # the probe entirely; re-validate it in case Tesseract moved.
+        settings = QSettings('ScanImage', 'Tesseract')
+        cached = settings.value('path')
+        if cached and os.path.exists(cached):
+            return cached
         try:
             tesseract_path = shutil.which('tesseract')
             if tesseract_path:
+                settings.setValue('path', tesseract_path)
                 return tesseract_path
             if sys.platform == 'win32':
                 common_paths = [
@@ -66,7 +311,10 @@ class PassportScannerApp(QMainWindow):
                 ]
                 for path in common_paths:
                     if os.path.exists(path):
+                        settings.setValue('path', path)
                         return path
+            # Last resort only: forking tesseract just to probe costs tens to
+            # hundreds of ms, so it runs only when which and known paths miss.
             subprocess.run(['tesseract', '--version'], check=True, stdout=subprocess.PIPE)
             return 'tesseract'
         except:
@@ -87,59 +335,132 @@ class PassportScannerApp(QMainWindow):
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getOpenFileName(self, "Open Passport Image", "", "Images (*.png *.jpg *.jpeg *.bmp)", options=options)
         if file_path:
+            # One half-resolution decode serves both the preview (via the
+            # zero-copy BGR888 path in display_image) and the scan worker,
+            # instead of decoding the same file once per consumer.
+            bgr = cv2.imread(file_path, cv2.IMREAD_REDUCED_COLOR_2)
+            if bgr is None:
+                self.text_output.setText("❌ Error: could not read image")
+                return
             self.current_image_path = file_path
-            pixmap = QPixmap(file_path)
-            self.image_label.setPixmap(pixmap.scaled(self.image_label.width(), self.image_label.height(), Qt.KeepAspectRatio))
-            self.scan_button.setEnabled(True)
+            self._bgr = bgr
+            self.display_image(bgr)
+            # Don't rearm the scan button while a worker is still running;
+            # the result slots re-enable it (and drop the stale result).
+            if self._scan_in_flight is None:
+                self.scan_button.setEnabled(True)
             self.text_output.clear()
 
-    def preprocess_image(self, img):
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    def preprocess_image(self, img, full_page=False):
+        """Binarize the MRZ region for OCR, returning (thresh, y_offset).
+
+        Otsu over the whole page mixes the photo area's pixel distribution
+        into the threshold estimate; restricting it to the MRZ band both
+        skips ~70% of the pixels and yields a cleaner split for the OCR-B
+        text. The band is downscaled toward MRZ_TARGET_CHAR_HEIGHT first.
+        full_page=True processes the entire image, for retries when the
+        band heuristic misses. y_offset maps ROI rows back to image rows.
+        """
+        y0 = 0 if full_page else int(img.shape[0] * (1 - MRZ_BAND_FRACTION))
+        roi = img[y0:, :]
+        if not full_page:
+            scale = MRZ_TARGET_CHAR_HEIGHT / (roi.shape[0] / 8)
+            if scale < 1.0:
+                roi = cv2.resize(roi, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        if cv2.ocl.haveOpenCL():
+            # UMat lets OpenCV dispatch the grayscale conversion and Otsu
+            # threshold to OpenCL (GPU/iGPU) when a device is available.
+            u = cv2.UMat(roi)
+            gray = cv2.cvtColor(u, cv2.COLOR_BGR2GRAY)
+            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            return thresh.get(), y0
+        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        return thresh
+        return thresh, y0
+
+    _DATE_RE = re.compile(r'^(\d{2})(\d{2})(\d{2})$')
 
     def parse_mrz_date(self, mrz_date):
-        if len(mrz_date) != 6 or not mrz_date.isdigit():
+        m = self._DATE_RE.match(mrz_date)
+        if not m:
             return "Invalid date"
-        if self.is_expiration_date:
-            year = "20" + mrz_date[:2]
-        else:
-            current_year_short = int(str(datetime.now().year)[2:])
-            year = "19" + mrz_date[:2] if int(mrz_date[:2]) > current_year_short else "20" + mrz_date[:2]
-        return f"{mrz_date[4:6]}/{mrz_date[2:4]}/{year}"
+        yy, mm, dd = map(int, m.groups())
+        century = 1900 if (not self.is_expiration_date and yy > CUR_YY) else 2000
+        return f"{dd:02d}/{mm:02d}/{century + yy}"
+
+    _NAME_RE = re.compile(r'[A-Z]+')
 
     def parse_mrz_name(self, mrz_name):
         """Convert MRZ name format (SURNAME<GIVENNAMES) to normal format."""
         if not mrz_name or not isinstance(mrz_name, str):
             return "Unknown"
-        
-        try:
-            if '<' in mrz_name:
-                parts = [part.strip() for part in mrz_name.split('<') if part.strip()]
-                if len(parts) >= 2:
-                    # Return "GIVENNAME SURNAME" format
-                    return f"{parts[1]} {parts[0]}"
-                return parts[0] if parts else "Unknown"
-            return mrz_name
-        except Exception as e:
-            print(f"Error parsing name: {e}")
+        if '<' not in mrz_name:
+            # Already in normal format (e.g. the 'Unknown' fallback or a
+            # space-joined names field); pass through untouched.
             return mrz_name
+        # One findall extracts the non-'<' tokens in C, replacing the
+        # split/strip/filter passes over the string.
+        parts = self._NAME_RE.findall(mrz_name)
+        if len(parts) >= 2:
+            # Return "GIVENNAME SURNAME" format
+            return f"{parts[1]} {parts[0]}"
+        return parts[0] if parts else "Unknown"
     
+    def highlight_mrz_area(self, img, vertices):
+        """Draw a closed polyline around the MRZ region on the display image.
+
+        vertices is a sequence of {'x': ..., 'y': ...} dicts. The point array
+        is built directly with np.fromiter at a known dtype/count rather than
+        through an intermediate Python list of tuples.
+        """
+        pts = np.fromiter(
+            (c for v in vertices for c in (v['x'], v['y'])),
+            dtype=np.int32, count=2 * len(vertices)
+        ).reshape(-1, 1, 2)
+        cv2.polylines(img, [pts], isClosed=True, color=(0, 255, 0), thickness=3)
+        return img
+
+    def ocr_mrz(self, processed_img):
+        """Run MRZ OCR on a preprocessed (binarized) image, returning an MRZ or None."""
+        self._ensure_ocr()
+        if self.ocr_api is not None:
+            from PIL import Image
+            # PyTessBaseAPI is not thread-safe and the warmup worker can
+            # overlap a user scan, so serialize SetImage/GetUTF8Text.
+            with self._ocr_lock:
+                self.ocr_api.SetImage(Image.fromarray(processed_img))
+                text = self.ocr_api.GetUTF8Text()
+            mrz = MRZ.from_ocr(text)
+            return mrz if mrz.valid_score > 0 else None
+        # Fallback: per-call tesseract CLI via passporteye.
+        _, png_data = cv2.imencode('.png', processed_img)
+        params = f'-l {self.ocr_lang} --psm 6 -c tessedit_char_whitelist=' + MRZ_CHAR_WHITELIST
+        if self.tessdata_dir:
+            params = f'--tessdata-dir {self.tessdata_dir} ' + params
+        return read_mrz(BytesIO(png_data.tobytes()), extra_cmdline_params=params)
+
     def scan_mrz(self):
         if not self.current_image_path:
             return
+        self.scan_button.setEnabled(False)
+        self._scan_in_flight = self.current_image_path
+        worker = MrzScanWorker(self, self.current_image_path, self._bgr)
+        worker.signals.finished.connect(self.on_scan_finished)
+        worker.signals.error.connect(self.on_scan_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_scan_finished(self, path, mrz, img, roi_y0, mrz_in_band):
+        self._scan_in_flight = None
+        self.scan_button.setEnabled(self.current_image_path is not None)
+        if path != self.current_image_path:
+            # The user loaded a different image while this scan ran; its
+            # result no longer matches what the window is showing.
+            return
+        if not mrz:
+            self.text_output.setText("No MRZ detected. Please ensure the image is high quality and well-aligned.")
+            return
         try:
-            img = cv2.imread(self.current_image_path)
-            processed_img = self.preprocess_image(img)
-            temp_path = "temp_mrz.png"
-            cv2.imwrite(temp_path, processed_img)
-            mrz = read_mrz(temp_path, extra_cmdline_params='--psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789<')
-            os.remove(temp_path)
-            if not mrz:
-                self.text_output.setText("No MRZ detected. Please ensure the image is high quality and well-aligned.")
-                return
             mrz_data = mrz.to_dict()
-            result_text = "🛂 Passport MRZ Data:\n\n"
             surname = mrz_data.get('surname', 'Unknown')
             #given_names = mrz_data.get('given_names', 'Unknown')
             self.is_expiration_date = True
@@ -156,19 +477,101 @@ class PassportScannerApp(QMainWindow):
                 ('Nationality', mrz_data.get('nationality', 'Unknown')),
                 ('Gender', 'Male' if mrz_data.get('sex') == 'M' else 'Female')
             ]
-            for field, value in fields:
-                result_text += f"• {field}: {value}\n"
-            self.text_output.setText(result_text)
+            lines = ["🛂 Passport MRZ Data:", ""]
+            lines.extend(f"• {field}: {value}" for field, value in fields)
+            self.text_output.setText("\n".join(lines))
+            if mrz_in_band:
+                h, w = img.shape[:2]
+                # Draw on a copy: img may be the cached self._bgr that a
+                # rescan will OCR again, and a green line through the MRZ
+                # band would skew its Otsu threshold.
+                img = self.highlight_mrz_area(img.copy(), [
+                    {'x': 0, 'y': roi_y0}, {'x': w - 1, 'y': roi_y0},
+                    {'x': w - 1, 'y': h - 1}, {'x': 0, 'y': h - 1}
+                ])
             self.display_image(img)
         except Exception as e:
             self.text_output.setText(f"❌ Error: {str(e)}")
 
+    def on_scan_error(self, path, message):
+        self._scan_in_flight = None
+        self.scan_button.setEnabled(self.current_image_path is not None)
+        if path != self.current_image_path:
+            return
+        self.text_output.setText(f"❌ Error: {message}")
+
+    def scan_mrz_batch(self, paths, on_result=None):
+        """Scan many passport images in parallel, one process per core.
+
+        OCR is CPU-bound and independent per image, so sharding across a
+        process pool scales roughly linearly with core count. Returns a dict
+        mapping each path to its MRZ data dict (or None when no MRZ found).
+        When on_result is given it is called with (path, data) as each image
+        completes, which FolderScanWorker uses to stream progress.
+        """
+        worker = functools.partial(_scan_one, tessdata_dir=self.tessdata_dir, lang=self.ocr_lang)
+        results = {}
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for path, data in zip(paths, pool.map(worker, paths)):
+                results[path] = data
+                if on_result is not None:
+                    on_result(path, data)
+        return results
+
+    def scan_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of Passport Images")
+        if not folder:
+            return
+        paths = sorted(
+            os.path.join(folder, name) for name in os.listdir(folder)
+            if name.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp'))
+        )
+        if not paths:
+            self.text_output.setText("No images found in the selected folder.")
+            return
+        self.scan_folder_button.setEnabled(False)
+        self.text_output.setText(f"🛂 Scanning {len(paths)} images:\n")
+        worker = FolderScanWorker(self, paths)
+        worker.signals.progress.connect(self.on_folder_progress)
+        worker.signals.finished.connect(self.on_folder_finished)
+        worker.signals.error.connect(self.on_folder_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_folder_progress(self, path, data):
+        if data:
+            self.text_output.append(f"• {os.path.basename(path)}: {data.get('number', 'Unknown')} ({data.get('surname', 'Unknown')})")
+        else:
+            self.text_output.append(f"• {os.path.basename(path)}: no MRZ detected")
+
+    def on_folder_finished(self, count):
+        self.scan_folder_button.setEnabled(True)
+        self.text_output.append(f"\nDone: {count} images scanned.")
+
+    def on_folder_error(self, message):
+        self.scan_folder_button.setEnabled(True)
+        self.text_output.setText(f"❌ Error: {message}")
+
     def display_image(self, img):
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        h, w, ch = img_rgb.shape
-        bytes_per_line = ch * w
-        q_img = QImage(img_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        self.image_label.setPixmap(QPixmap.fromImage(q_img).scaled(self.image_label.width(), self.image_label.height(), Qt.KeepAspectRatio))
+        target_w = self.image_label.width()
+        target_h = self.image_label.height()
+        h, w, ch = img.shape
+        if w > target_w or h > target_h:
+            # Downscale to the final display size with OpenCV's SIMD
+            # INTER_AREA so Qt never runs its scaler over the full frame.
+            scale = min(target_w / w, target_h / h)
+            img = cv2.resize(img, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+            h, w = img.shape[:2]
+        # Format_BGR888 consumes the OpenCV buffer as-is, skipping the full
+        # BGR->RGB copy. QImage only borrows the pointer, so keep the ndarray
+        # alive for as long as the pixmap might reference it.
+        self._last_img = img
+        q_img = QImage(img.data, w, h, ch * w, QImage.Format_BGR888)
+        self.image_label.setPixmap(QPixmap.fromImage(q_img))
+
+    def closeEvent(self, event):
+        if self.ocr_api is not None:
+            self.ocr_api.End()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)